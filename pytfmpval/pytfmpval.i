@@ -8,9 +8,30 @@
 %include "std_string.i"
 %include "std_vector.i"
 %include "typemaps.i"
+
+%apply double *OUTPUT { double *score, double *pmin, double *pmax, double *rpv, double *rppv };
+%apply long long *INOUT { long long *min, long long *max };
+
+%template(DoubleVector) std::vector<double>;
+
+/* The heavy computations don't touch Python objects, so let other threads run meanwhile.
+ * A Matrix must still not be used from several threads at once. */
+%define RELEASE_GIL(method)
+%exception method {
+  Py_BEGIN_ALLOW_THREADS
+  $action
+  Py_END_ALLOW_THREADS
+}
+%enddef
+
+RELEASE_GIL(Matrix::computesIntegerMatrix)
+RELEASE_GIL(Matrix::lookForPvalue)
+RELEASE_GIL(Matrix::lookForPvalues)
+RELEASE_GIL(Matrix::lookForScore)
+RELEASE_GIL(Matrix::refinePvalue)
+RELEASE_GIL(Matrix::refineScore)
+
 %include "../src/Matrix.h"
 
 %pointer_class(double, doublep)
 %pointer_class(int, intp)
-
-%nodefaultdtor Matrix;
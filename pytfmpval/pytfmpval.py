@@ -159,6 +159,119 @@ class SwigPyIterator(_object):
 SwigPyIterator_swigregister = _pytfmpval.SwigPyIterator_swigregister
 SwigPyIterator_swigregister(SwigPyIterator)
 
+class DoubleVector(_object):
+    __swig_setmethods__ = {}
+    __setattr__ = lambda self, name, value: _swig_setattr(self, DoubleVector, name, value)
+    __swig_getmethods__ = {}
+    __getattr__ = lambda self, name: _swig_getattr(self, DoubleVector, name)
+    __repr__ = _swig_repr
+
+    def iterator(self):
+        return _pytfmpval.DoubleVector_iterator(self)
+    def __iter__(self):
+        return self.iterator()
+
+    def __nonzero__(self):
+        return _pytfmpval.DoubleVector___nonzero__(self)
+
+    def __bool__(self):
+        return _pytfmpval.DoubleVector___bool__(self)
+
+    def __len__(self):
+        return _pytfmpval.DoubleVector___len__(self)
+
+    def __getslice__(self, i, j):
+        return _pytfmpval.DoubleVector___getslice__(self, i, j)
+
+    def __setslice__(self, *args):
+        return _pytfmpval.DoubleVector___setslice__(self, *args)
+
+    def __delslice__(self, i, j):
+        return _pytfmpval.DoubleVector___delslice__(self, i, j)
+
+    def __delitem__(self, *args):
+        return _pytfmpval.DoubleVector___delitem__(self, *args)
+
+    def __getitem__(self, *args):
+        return _pytfmpval.DoubleVector___getitem__(self, *args)
+
+    def __setitem__(self, *args):
+        return _pytfmpval.DoubleVector___setitem__(self, *args)
+
+    def pop(self):
+        return _pytfmpval.DoubleVector_pop(self)
+
+    def append(self, x):
+        return _pytfmpval.DoubleVector_append(self, x)
+
+    def empty(self):
+        return _pytfmpval.DoubleVector_empty(self)
+
+    def size(self):
+        return _pytfmpval.DoubleVector_size(self)
+
+    def swap(self, v):
+        return _pytfmpval.DoubleVector_swap(self, v)
+
+    def begin(self):
+        return _pytfmpval.DoubleVector_begin(self)
+
+    def end(self):
+        return _pytfmpval.DoubleVector_end(self)
+
+    def rbegin(self):
+        return _pytfmpval.DoubleVector_rbegin(self)
+
+    def rend(self):
+        return _pytfmpval.DoubleVector_rend(self)
+
+    def clear(self):
+        return _pytfmpval.DoubleVector_clear(self)
+
+    def get_allocator(self):
+        return _pytfmpval.DoubleVector_get_allocator(self)
+
+    def pop_back(self):
+        return _pytfmpval.DoubleVector_pop_back(self)
+
+    def erase(self, *args):
+        return _pytfmpval.DoubleVector_erase(self, *args)
+
+    def __init__(self, *args):
+        this = _pytfmpval.new_DoubleVector(*args)
+        try:
+            self.this.append(this)
+        except __builtin__.Exception:
+            self.this = this
+
+    def push_back(self, x):
+        return _pytfmpval.DoubleVector_push_back(self, x)
+
+    def front(self):
+        return _pytfmpval.DoubleVector_front(self)
+
+    def back(self):
+        return _pytfmpval.DoubleVector_back(self)
+
+    def assign(self, n, x):
+        return _pytfmpval.DoubleVector_assign(self, n, x)
+
+    def resize(self, *args):
+        return _pytfmpval.DoubleVector_resize(self, *args)
+
+    def insert(self, *args):
+        return _pytfmpval.DoubleVector_insert(self, *args)
+
+    def reserve(self, n):
+        return _pytfmpval.DoubleVector_reserve(self, n)
+
+    def capacity(self):
+        return _pytfmpval.DoubleVector_capacity(self)
+    __swig_destroy__ = _pytfmpval.delete_DoubleVector
+    __del__ = lambda self: None
+DoubleVector_swigregister = _pytfmpval.DoubleVector_swigregister
+DoubleVector_swigregister(DoubleVector)
+
 class Matrix(_object):
     __swig_setmethods__ = {}
     __setattr__ = lambda self, name, value: _swig_setattr(self, Matrix, name, value)
@@ -244,6 +357,8 @@ class Matrix(_object):
             self.this.append(this)
         except __builtin__.Exception:
             self.this = this
+    __swig_destroy__ = _pytfmpval.delete_Matrix
+    __del__ = lambda self: None
 
     def toLogOddRatio(self):
         return _pytfmpval.Matrix_toLogOddRatio(self)
@@ -257,11 +372,20 @@ class Matrix(_object):
     def showDistrib(self, min, max):
         return _pytfmpval.Matrix_showDistrib(self, min, max)
 
-    def lookForPvalue(self, requestedScore, min, max, pmin, pmax):
-        return _pytfmpval.Matrix_lookForPvalue(self, requestedScore, min, max, pmin, pmax)
+    def lookForPvalue(self, requestedScore, min, max):
+        return _pytfmpval.Matrix_lookForPvalue(self, requestedScore, min, max)
+
+    def lookForPvalues(self, requestedScores):
+        return _pytfmpval.Matrix_lookForPvalues(self, requestedScores)
+
+    def lookForScore(self, min, max, requestedPvalue):
+        return _pytfmpval.Matrix_lookForScore(self, min, max, requestedPvalue)
 
-    def lookForScore(self, min, max, requestedPvalue, rpv, rppv):
-        return _pytfmpval.Matrix_lookForScore(self, min, max, requestedPvalue, rpv, rppv)
+    def refinePvalue(self, requestedScore, granularity):
+        return _pytfmpval.Matrix_refinePvalue(self, requestedScore, granularity)
+
+    def refineScore(self, requestedPvalue, granularity, decrgr, min, max):
+        return _pytfmpval.Matrix_refineScore(self, requestedPvalue, granularity, decrgr, min, max)
 
     def calcDistribWithMapMinMax(self, min, max):
         return _pytfmpval.Matrix_calcDistribWithMapMinMax(self, min, max)
@@ -277,8 +401,6 @@ class Matrix(_object):
 
     def readHorizontalMatrix(self, filename):
         return _pytfmpval.Matrix_readHorizontalMatrix(self, filename)
-    __swig_destroy__ = _pytfmpval.delete_Matrix
-    __del__ = lambda self: None
 Matrix_swigregister = _pytfmpval.Matrix_swigregister
 Matrix_swigregister(Matrix)
 
@@ -31,9 +31,108 @@ Copyright (C) 2017  Jared Andrews
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 import pytfmpval.pytfmpval as tfm
-import psutil
+import sys
+import time
+import weakref
+from collections import OrderedDict
 from math import ceil
 
+# psutil is imported on first use, see _available_memory().
+_psutil = None
+
+# Available memory is read at most once per _MEM_POLL_INTERVAL seconds. Reading it costs tens of
+# microseconds, more than a whole pass at coarse granularities for short motifs.
+_MEM_POLL_INTERVAL = 0.1
+_mem_read_at = None
+_mem_available = None
+_clock = getattr(time, "monotonic", time.time)
+
+# Results are refined starting at _INIT_GRANULARITY, making the granularity _DECRGR times finer
+# after each pass until _MAX_GRANULARITY is reached.
+_INIT_GRANULARITY = 0.1
+_MAX_GRANULARITY = 1e-10
+_DECRGR = 10
+
+_GB = 1000 * 1024 * 1024  # Bytes per GB of mem_thresh.
+
+# Smallest relative tolerance used, a few ulps. Bounds closer than this only differ by rounding.
+_MIN_RTOL = 4 * sys.float_info.epsilon
+
+# Largest spread of the scores score2pval_many() looks up together, as a fraction of the matrix score range.
+_GROUP_SPAN = 0.05
+
+# Results already computed for each matrix, keyed on the requested score or p-value,
+# with the p-values bounding them. Held weakly so cached entries go away with their matrix.
+# Each matrix keeps its _CACHE_SIZE most recently used results.
+_pval_cache = weakref.WeakKeyDictionary()
+_score_cache = weakref.WeakKeyDictionary()
+_CACHE_SIZE = 4096
+
+
+def clear_cache(matrix=None):
+    """
+    Forget cached p-values and scores.
+
+    Results of score2pval() and pval2score() are cached per matrix, keeping the 4096 most recently used of each.
+    If a matrix is modified in place after it has been queried (e.g. by calling toLogOddRatio() on it), its
+    cached results must be cleared.
+
+    Args:
+        matrix (pytfmpval Matrix): Matrix for which to clear cached results. If None, the cache is
+            cleared for all matrices.
+    """
+
+    if matrix is None:
+        _pval_cache.clear()
+        _score_cache.clear()
+    else:
+        _pval_cache.pop(matrix, None)
+        _score_cache.pop(matrix, None)
+
+
+def _available_memory():
+    """
+    Return the memory available to the system in bytes.
+
+    If psutil is not installed, the memory threshold can't be checked and infinity is returned.
+    """
+
+    global _psutil, _mem_read_at, _mem_available
+    if _psutil is None:
+        try:
+            import psutil as _psutil
+        except ImportError:
+            _psutil = False
+
+    if not _psutil:
+        return float("inf")
+
+    now = _clock()
+    if _mem_read_at is None or now - _mem_read_at >= _MEM_POLL_INTERVAL:
+        _mem_available = _psutil.virtual_memory().available
+        _mem_read_at = now
+    return _mem_available
+
+
+# Log-odds conversion for count matrices, by log type.
+_LOG_ODDS = {"NAT": tfm.Matrix.toLogOddRatio,
+             "LOG2": tfm.Matrix.toLog2OddRatio}
+
+
+def _to_log_odds(m, mat_type, log_type):
+    """
+    Convert a count matrix to a log-odds (position weight) matrix in place. Other matrix types are left as is.
+    """
+
+    if mat_type.upper() != "COUNTS":
+        return
+
+    to_log_odds = _LOG_ODDS.get(log_type.upper())
+    if to_log_odds is None:
+        print("Improper log type argument, using natural log.")
+        to_log_odds = tfm.Matrix.toLogOddRatio
+    to_log_odds(m)
+
 
 def create_matrix(matrix_file, bg=[0.25, 0.25, 0.25, 0.25], mat_type="counts", log_type="nat"):
     """
@@ -61,14 +160,7 @@ def create_matrix(matrix_file, bg=[0.25, 0.25, 0.25, 0.25], mat_type="counts", l
     m = tfm.Matrix(a, c, g, t)
     m.readJasparMatrix(matrix_file)
 
-    if mat_type.upper() == "COUNTS":
-        if log_type.upper() == "NAT":
-            m.toLogOddRatio()
-        elif log_type.upper() == "LOG2":
-            m.toLog2OddRatio()
-        else:
-            print("Improper log type argument, using natural log.")
-            m.toLogOddRatio()
+    _to_log_odds(m, mat_type, log_type)
 
     return m
 
@@ -96,20 +188,12 @@ def read_matrix(matrix, bg=[0.25, 0.25, 0.25, 0.25], mat_type="counts", log_type
 
     try:
         a, c, g, t = bg[0], bg[1], bg[2], bg[3]
-        if (len(matrix.split()) % 4) != 0:
-            raise ValueError("Uneven rows in motif matrix. Ensure rows of equal length in input.")
 
         m = tfm.Matrix(a, c, g, t)
-        m.readMatrix(matrix)
+        if not m.readMatrix(matrix):
+            raise ValueError("Uneven rows in motif matrix. Ensure rows of equal length in input.")
 
-        if mat_type.upper() == "COUNTS":
-            if log_type.upper() == "NAT":
-                m.toLogOddRatio()
-            elif log_type.upper() == "LOG2":
-                m.toLog2OddRatio()
-            else:
-                print("Improper log type argument, using natural log.")
-                m.toLogOddRatio()
+        _to_log_odds(m, mat_type, log_type)
 
         return m
 
@@ -117,7 +201,52 @@ def read_matrix(matrix, bg=[0.25, 0.25, 0.25, 0.25], mat_type="counts", log_type
         print(repr(error))
 
 
-def score2pval(matrix, req_score, mem_thresh=2.0):
+def _converged(ppv, pv, rtol, atol):
+    """
+    Whether the p-values bounding a result are close enough to stop refining it.
+    """
+
+    return abs(ppv - pv) <= atol + max(rtol, _MIN_RTOL) * abs(pv)
+
+
+def _matrix_cache(cache, matrix):
+    """
+    Return the cache of results for matrix from _pval_cache or _score_cache, creating it if needed.
+    """
+
+    cached = cache.get(matrix)
+    if cached is None:
+        cached = cache[matrix] = OrderedDict()
+    return cached
+
+
+def _cached(cached, key, rtol, atol):
+    """
+    Return the cached result for key if it was computed within the given tolerance, else None.
+    """
+
+    hit = cached.pop(key, None)
+    if hit is None:
+        return None
+
+    cached[key] = hit  # Most recently used.
+    if _converged(hit[1], hit[2], rtol, atol):
+        return hit[0]
+    return None
+
+
+def _cache(cached, key, result, ppv, pv):
+    """
+    Store a result with the p-values bounding it, dropping the least recently used one if the cache is full.
+    """
+
+    cached.pop(key, None)
+    if len(cached) >= _CACHE_SIZE:
+        cached.popitem(last=False)
+    cached[key] = (result, ppv, pv)
+
+
+def score2pval(matrix, req_score, mem_thresh=2.0, rtol=1e-9, atol=0.0):
     """
     Determine the p-value for a given score for a specific motif PWM.
 
@@ -132,42 +261,43 @@ def score2pval(matrix, req_score, mem_thresh=2.0):
             calculated after each pass, each of which is more time and memory
             intensive than the last, so changing this value isn't recommended
             unless accuracy out to the 8th decimal place is really necessary.
+            Only checked if psutil is installed.
+        rtol (float): Relative tolerance. Refinement stops once the p-values bounding the result
+            differ by no more than atol + rtol * p-value. Each pass is more time and memory intensive
+            than the last, so this avoids the final passes when only a few significant digits are needed.
+            Set both rtol and atol to 0 to only stop once they agree to within rounding error.
+        atol (float): Absolute tolerance, see rtol.
 
     Returns:
         pv (float): The calculated p-value corresponding to the score.
     """
 
-    mem_thresh = mem_thresh * 1000 * 1024 * 1024
-    granularity = 0.1
-    max_granularity = 1e-10
-    decrgr = 10  # Factor to increase granularity by after each iteration.
+    cached = _matrix_cache(_pval_cache, matrix)
+    pv = _cached(cached, req_score, rtol, atol)
+    if pv is not None:
+        return pv
 
-    pv = tfm.doublep()
-    ppv = tfm.doublep()
+    mem_thresh = mem_thresh * _GB
+    granularity = _INIT_GRANULARITY
 
-    while granularity > max_granularity:
-        matrix.computesIntegerMatrix(granularity)
-        max_s = int(req_score * matrix.granularity + matrix.offset + matrix.errorMax + 1)
-        min_s = int(req_score * matrix.granularity + matrix.offset - matrix.errorMax - 1)
-        score = int(req_score * matrix.granularity + matrix.offset)
-
-        matrix.lookForPvalue(score, min_s, max_s, ppv, pv)
+    while granularity > _MAX_GRANULARITY:
+        ppv, pv = matrix.refinePvalue(req_score, granularity)
 
-        mem = psutil.virtual_memory()
-        if mem.available <= mem_thresh:
+        if _available_memory() <= mem_thresh:
             print("Memory usage threshold passed, returning closest approximation.")
-            return pv.value()
+            return pv
 
-        if ppv.value() == pv.value():
-            return pv.value()
+        if _converged(ppv, pv, rtol, atol):
+            _cache(cached, req_score, pv, ppv, pv)
+            return pv
 
-        granularity = granularity / decrgr
+        granularity = granularity / _DECRGR
 
     print("Max granularity exceeded. Returning closest approximation.")
-    return pv.value()
+    return pv
 
 
-def pval2score(matrix, pval, mem_thresh=2.0):
+def pval2score(matrix, pval, mem_thresh=2.0, rtol=1e-9, atol=0.0):
     """
     Determine the score for a given p-value for a specific motif PWM.
 
@@ -182,42 +312,176 @@ def pval2score(matrix, pval, mem_thresh=2.0):
             calculated after each pass, each of which is more time and memory
             intensive than the last, so changing this value isn't recommended
             unless accuracy out to the 8th decimal place is really necessary.
+            Only checked if psutil is installed.
+        rtol (float): Relative tolerance. Refinement stops once the p-values bounding the result
+            differ by no more than atol + rtol * p-value. Each pass is more time and memory intensive
+            than the last, so this avoids the final passes when only a few significant digits are needed.
+            Set both rtol and atol to 0 to only stop once they agree to within rounding error.
+        atol (float): Absolute tolerance, see rtol.
 
     Returns:
         score (float): The calculated score corresponding to the p-value.
     """
-    mem_thresh = mem_thresh * 1000 * 1024 * 1024
-    init_granularity = 0.1
-    max_granularity = 1e-10
-    decrgr = 10  # Factor to increase granularity by after each iteration.
 
-    pv = tfm.doublep()  # Initialize as a c++ double.
-    ppv = tfm.doublep()
-    matrix.computesIntegerMatrix(init_granularity)
+    cached = _matrix_cache(_score_cache, matrix)
+    score = _cached(cached, pval, rtol, atol)
+    if score is not None:
+        return score
+
+    mem_thresh = mem_thresh * _GB
+
+    matrix.computesIntegerMatrix(_INIT_GRANULARITY)
     max_s = int(matrix.maxScore + ceil(matrix.errorMax + 0.5))
     min_s = int(matrix.minScore)
-    granularity = init_granularity
+    granularity = _INIT_GRANULARITY
 
-    while granularity > max_granularity:
-        matrix.computesIntegerMatrix(granularity)
+    while granularity > _MAX_GRANULARITY:
+        min_s, max_s, score, pv, ppv = matrix.refineScore(pval, granularity, _DECRGR, min_s, max_s)
+
+        if _converged(ppv, pv, rtol, atol):
+            _cache(cached, pval, score, ppv, pv)
+            return score
+
+        if _available_memory() <= mem_thresh:
+            print("Memory usage threshold passed, returning closest score approximation.")
+            break
 
-        score = matrix.lookForScore(min_s, max_s, pval, pv, ppv)
+        granularity = granularity / _DECRGR
+
+    if granularity <= _MAX_GRANULARITY:
+        print("Max granularity exceeded. Returning closest score approximation.")
+
+    return score
+
+
+def score2pval_many(matrix, req_scores, mem_thresh=2.0, rtol=1e-9, atol=0.0):
+    """
+    Determine the p-values for several scores for a specific motif PWM.
+
+    The integer matrix is only computed once per pass for all scores that have not yet converged, and
+    scores close to each other share a single score distribution. The p-values are therefore summed in a
+    different order than by score2pval(), and agree with it to within rounding error rather than exactly.
+    Both functions share the same cache, so a cached result may come from either of them.
+
+    Args:
+        matrix (pytfmpval Matrix): Matrix in pwm format.
+        req_scores (list of floats): Requested scores for which to determine the p-values.
+        mem_thresh (float): Memory in GBs to remain free to system. See score2pval().
+        rtol (float): Relative tolerance. See score2pval().
+        atol (float): Absolute tolerance. See score2pval().
+
+    Returns:
+        pvs (list of floats): The calculated p-values corresponding to the scores, in the same order.
+    """
 
-        min_s = int((score - ceil(matrix.errorMax + 0.5)) * decrgr)
-        max_s = int((score + ceil(matrix.errorMax + 0.5)) * decrgr)
+    cached = _matrix_cache(_pval_cache, matrix)
+    pvs = [_cached(cached, s, rtol, atol) for s in req_scores]
+    pending = sorted((i for i, p in enumerate(pvs) if p is None), key=lambda i: req_scores[i])
 
-        if ppv.value() == pv.value():
+    mem_thresh = mem_thresh * _GB
+    granularity = _INIT_GRANULARITY
+
+    while pending and granularity > _MAX_GRANULARITY:
+        matrix.computesIntegerMatrix(granularity)
+        # Scores close to each other are looked up from a single distribution. Wider groups make
+        # that distribution more expensive to compute than looking each score up on its own.
+        group_span = _GROUP_SPAN * (matrix.maxScore - matrix.minScore) / matrix.granularity
+        unconverged = []
+
+        start = 0
+        while start < len(pending):
+            end = start + 1
+            while end < len(pending) and req_scores[pending[end]] - req_scores[pending[start]] <= group_span:
+                end += 1
+            group = pending[start:end]
+            bounds = matrix.lookForPvalues([req_scores[i] for i in group])
+
+            for j, i in enumerate(group):
+                ppv, pv = bounds[2 * j], bounds[2 * j + 1]
+                pvs[i] = pv
+
+                if _converged(ppv, pv, rtol, atol):
+                    _cache(cached, req_scores[i], pv, ppv, pv)
+                else:
+                    unconverged.append(i)
+
+            start = end
+
+        pending = unconverged
+        if not pending:
             break
 
-        mem = psutil.virtual_memory()
-        if mem.available <= mem_thresh:
-            print("Memory usage threshold passed, returning closest score approximation.")
+        if _available_memory() <= mem_thresh:
+            print("Memory usage threshold passed, returning closest approximations.")
+            return pvs
+
+        granularity = granularity / _DECRGR
+
+    if pending:
+        print("Max granularity exceeded. Returning closest approximations.")
+    return pvs
+
+
+def pval2score_many(matrix, pvals, mem_thresh=2.0, rtol=1e-9, atol=0.0):
+    """
+    Determine the scores for several p-values for a specific motif PWM.
+
+    Gives the same results as calling pval2score() for each p-value, but the integer matrix is only
+    computed once per pass for all p-values that have not yet converged.
+
+    Args:
+        matrix (pytfmpval Matrix): Matrix in pwm format.
+        pvals (list of floats): p-values for which to determine the scores.
+        mem_thresh (float): Memory in GBs to remain free to system. See pval2score().
+        rtol (float): Relative tolerance. See pval2score().
+        atol (float): Absolute tolerance. See pval2score().
+
+    Returns:
+        scores (list of floats): The calculated scores corresponding to the p-values, in the same order.
+    """
+
+    cached = _matrix_cache(_score_cache, matrix)
+    scores = [_cached(cached, p, rtol, atol) for p in pvals]
+    pending = [i for i, s in enumerate(scores) if s is None]
+    if not pending:
+        return scores
+
+    mem_thresh = mem_thresh * _GB
+
+    matrix.computesIntegerMatrix(_INIT_GRANULARITY)
+    max_s = int(matrix.maxScore + ceil(matrix.errorMax + 0.5))
+    min_s = int(matrix.minScore)
+    bounds = dict((i, (min_s, max_s)) for i in pending)
+    granularity = _INIT_GRANULARITY
+
+    while pending and granularity > _MAX_GRANULARITY:
+        matrix.computesIntegerMatrix(granularity)
+        # Matrix attributes are read through SWIG, so only do it once per pass.
+        int_granularity, offset = matrix.granularity, matrix.offset
+        error = ceil(matrix.errorMax + 0.5)
+        unconverged = []
+
+        for i in pending:
+            min_s, max_s = bounds[i]
+            score, pv, ppv = matrix.lookForScore(min_s, max_s, pvals[i])
+            scores[i] = (score - offset) / int_granularity
+
+            if _converged(ppv, pv, rtol, atol):
+                _cache(cached, pvals[i], scores[i], ppv, pv)
+            else:
+                bounds[i] = (int((score - error) * _DECRGR), int((score + error) * _DECRGR))
+                unconverged.append(i)
+
+        pending = unconverged
+        if not pending:
             break
 
-        granularity = granularity / decrgr
+        if _available_memory() <= mem_thresh:
+            print("Memory usage threshold passed, returning closest score approximations.")
+            return scores
 
-    if granularity <= max_granularity:
-        print("Max granularity exceeded. Returning closest score approximation.")
+        granularity = granularity / _DECRGR
 
-    final_score = (score - matrix.offset) / matrix.granularity
-    return final_score
+    if pending:
+        print("Max granularity exceeded. Returning closest score approximations.")
+    return scores
@@ -6,11 +6,26 @@ setup.py file for pytfmpval
 
 # from distutils.core import setup, Extension
 from setuptools import find_packages, setup, Extension
+import os
+import sys
 
+# Optimization flags for GCC/Clang. -ffp-contract=off keeps results identical whether or not
+# the target has FMA instructions. -ffast-math is deliberately not used: it breaks the exact
+# p-value comparisons and changes floating point behaviour for the whole Python process.
+# Set PYTFMPVAL_MARCH (e.g. "native") to build for a specific CPU, which isn't portable.
+extra_compile_args = []
+extra_link_args = []
+if sys.platform != 'win32':
+    extra_compile_args = ['-O3', '-funroll-loops', '-ffp-contract=off', '-flto']
+    extra_link_args = ['-flto']
+    if os.environ.get('PYTFMPVAL_MARCH'):
+        extra_compile_args.append('-march=' + os.environ['PYTFMPVAL_MARCH'])
 
 pytfmpval_module = Extension('_pytfmpval',
                              sources=['src/Matrix.cpp', 'pytfmpval/pytfmpval_wrap.cxx'],
                              swig_opts=['-c++'],
+                             extra_compile_args=extra_compile_args,
+                             extra_link_args=extra_link_args,
                              language='c++'
                              )
 
@@ -23,8 +38,7 @@ setup(name='pytfmpval',
       license='GPL-3.0',
       keywords='bioinformatics tfmpvalue motifs transcription factor genomics science',
       ext_modules=[pytfmpval_module],
-      py_modules=["pytfmpval"],
-      install_requires=["psutil"],
+      extras_require={"memcheck": ["psutil"]},
       packages=find_packages(exclude=("tests", "docs")),
       classifiers=['Development Status :: 4 - Beta',
                    'Intended Audience :: Science/Research',
@@ -12,10 +12,32 @@
 
 #define MEMORYCOUNT
 
+void Matrix::freeIntegerMatrix () {
+  
+  if (matInt == NULL) {
+    return;
+  }
+  
+  delete[] minScoreColumn;
+  delete[] maxScoreColumn;
+  delete[] bestScore;
+  delete[] worstScore;
+  delete[] offsets;
+  for (int k = 0; k < 4; k++) {        
+    delete[] matInt[k];
+  }
+  delete[] matInt;
+  matInt = NULL;
+  
+}
+
+
 void Matrix::computesIntegerMatrix (double granularity, bool sortColumns) {
   double minS = 0, maxS = 0;
   double scoreRange;
   
+  freeIntegerMatrix();
+  
   // computes precision
   for (int i = 0; i < length; i++) {
     double min = mat[0][i];
@@ -39,7 +61,7 @@ void Matrix::computesIntegerMatrix (double granularity, bool sortColumns) {
     this->granularity = 1.0;
   }
   
-  matInt = new long long *[length];
+  matInt = new long long *[4];
   for (int k = 0; k < 4; k++ ) {
     matInt[k] = new long long[length];
     for (int p = 0 ; p < length; p++) {
@@ -199,15 +221,69 @@ void Matrix::lookForPvalue (long long requestedScore, long long min, long long m
   *pmin = iter->second;
 
   delete[] nbocc;
-  delete[] minScoreColumn;
-  delete[] maxScoreColumn;
-  delete[] bestScore;
-  delete[] worstScore;
-  delete[] offsets;
-  for (int k = 0; k < 4; k++) {        
-      delete[] matInt[k];
+  
+}
+
+
+
+/**
+* Computes the pvalues associated with several real scores from a single distribution.
+ */
+vector<double> Matrix::lookForPvalues (const vector<double> &requestedScores) {
+  
+  vector<double> pvalues(2 * requestedScores.size());
+  if (requestedScores.empty()) {
+    return pvalues;
+  }
+  
+  // the window of each score is the one lookForPvalue would use, the distribution covers them all
+  vector<long long> scores(requestedScores.size()), mins(requestedScores.size()), maxs(requestedScores.size());
+  for (unsigned int i = 0; i < requestedScores.size(); i++) {
+    double score = requestedScores[i] * this->granularity + this->offset;
+    scores[i] = (long long)score;
+    mins[i] = (long long)(score - errorMax - 1);
+    maxs[i] = (long long)(score + errorMax + 1);
+  }
+  long long min = *min_element(mins.begin(), mins.end());
+  long long max = *max_element(maxs.begin(), maxs.end());
+  
+  map<long long, double> *nbocc = calcDistribWithMapMinMax(min,max); 
+  map<long long, double>::iterator iter;
+  
+  // computes p values and stores them in nbocc[length] 
+  double sum = 0.0;
+  map<long long, double>::reverse_iterator riter = nbocc[length-1].rbegin();
+  while (riter != nbocc[length-1].rend()) {
+    sum += riter->second;
+    nbocc[length][riter->first] = sum;
+    riter++;      
+  }
+  
+  for (unsigned int i = 0; i < requestedScores.size(); i++) {
+    // scores above maxs[i] are all gathered in maxs[i]+1 by lookForPvalue
+    iter = nbocc[length].lower_bound(scores[i]);
+    long long s = (iter->first > maxs[i]) ? maxs[i] + 1 : iter->first;
+    pvalues[2*i+1] = iter->second;
+    
+    // first score below s - errorMax, or the lowest score of the window of lookForPvalue
+    iter = nbocc[length].lower_bound((long long)ceil(s - errorMax));
+    if (iter != nbocc[length].begin() && (--iter)->first >= mins[i]) {
+      pvalues[2*i] = iter->second;
+    } else {
+      pvalues[2*i] = nbocc[length].lower_bound(mins[i])->second;
     }
-  delete[] matInt;
+  }
+  
+#ifdef MEMORYCOUNT
+  // for tests, store the number of memory bloc necessary
+  for (int pos = 0; pos <= length; pos++) {
+    totalMapSize += nbocc[pos].size();
+  }
+#endif
+  
+  delete[] nbocc;
+  
+  return pvalues;
   
 }
 
@@ -266,18 +342,41 @@ long long Matrix::lookForScore (long long min, long long max, double requestedPv
   *rppv = nbocc[length][alpha_E];   
   
   delete[] nbocc;
-  delete[] minScoreColumn;
-  delete[] maxScoreColumn;
-  delete[] bestScore;
-  delete[] worstScore;
-  delete[] offsets;
-  delete[] matInt;
 
   return alpha;
   
 }
 
 
+/**
+* One refinement pass of the score to pvalue computation.
+ */
+void Matrix::refinePvalue (double requestedScore, double granularity, double *pmin, double *pmax) {
+  
+  computesIntegerMatrix(granularity);
+  double score = requestedScore * this->granularity + this->offset;
+  lookForPvalue((long long)score, (long long)(score - errorMax - 1), (long long)(score + errorMax + 1), pmin, pmax);
+  
+}
+
+
+
+/**
+* One refinement pass of the pvalue to score computation.
+ */
+void Matrix::refineScore (double requestedPvalue, double granularity, int decrgr, long long *min, long long *max, double *score, double *rpv, double *rppv) {
+  
+  computesIntegerMatrix(granularity);
+  long long alpha = lookForScore(*min, *max, requestedPvalue, rpv, rppv);
+  long long error = (long long)ceil(errorMax + 0.5);
+  
+  *min = (alpha - error) * decrgr;
+  *max = (alpha + error) * decrgr;
+  *score = (alpha - offset) / this->granularity;
+  
+}
+
+
 // computes the distribution of scores between score min and max as the DP algrithm proceeds 
 // but instead of using a table we use a map to avoid computations for scores that cannot be reached
 map<long long, double> *Matrix::calcDistribWithMapMinMax (long long min, long long max) { 
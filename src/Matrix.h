@@ -12,6 +12,7 @@
 #ifndef __MATRIX__
 #define __MATRIX__
 
+#include <algorithm>
 #include <string>
 #include <vector>
 #include <map>
@@ -56,6 +57,11 @@ private:
     }
   }
   
+  /**
+  * Frees the integer matrix and the arrays derived from it, if any.
+   */
+  void freeIntegerMatrix ();
+  
   
 public:
   
@@ -84,38 +90,64 @@ public:
   Matrix() {
     granularity = 1.0;
     offset = 0;
+    length = 0;
+    mat = NULL;
+    matInt = NULL;
     background[0] = background[1] = background[2] = background[3] = 0.25;
   }
   
   Matrix(double pA, double pC, double pG, double pT) {
     granularity = 1.0;
     offset = 0;
+    length = 0;
+    mat = NULL;
+    matInt = NULL;
     background[0] = pA;
     background[1] = pC;
     background[2] = pG;
     background[3] = pT;  
   }
+  
+  ~Matrix() {
+    freeIntegerMatrix();
+    if (mat != NULL) {
+      for (int k = 0; k < 4; k++) {
+        delete[] mat[k];
+      }
+      delete[] mat;
+    }
+  }
     
   void toLogOddRatio () {
+    double logBackground[4];
+    for (int k = 0; k < 4; k++) {
+      logBackground[k] = log(background[k]);
+    }
     for (int p = 0; p < length; p++) {
       double sum = mat[0][p] + mat[1][p] + mat[2][p] + mat[3][p];
       for (int k = 0; k < 4; k++) {
-        mat[k][p] = log((mat[k][p] + 0.25) /(sum + 1)) - log (background[k]); 
+        mat[k][p] = log((mat[k][p] + 0.25) /(sum + 1)) - logBackground[k]; 
       }
     }
   }
 
   void toLog2OddRatio () {
+    double logBackground[4];
+    for (int k = 0; k < 4; k++) {
+      logBackground[k] = log2(background[k]);
+    }
     for (int p = 0; p < length; p++) {
       double sum = mat[0][p] + mat[1][p] + mat[2][p] + mat[3][p];
       for (int k = 0; k < 4; k++) {
-        mat[k][p] = log2((mat[k][p] + 0.25) /(sum + 1)) - log2 (background[k]); 
+        mat[k][p] = log2((mat[k][p] + 0.25) /(sum + 1)) - logBackground[k]; 
       }
     }
   }
   
   /**
     * Transforms the initial matrix into an integer and offseted matrix.
+    * The integer matrix is kept until the next call, so several pvalues
+    * or scores can be looked for at the same granularity.
    */
   void computesIntegerMatrix (double granularity, bool sortColumns = true);
   
@@ -145,11 +177,35 @@ public:
     */
   void lookForPvalue (long long requestedScore, long long min, long long max, double *pmin, double *pmax);
     
+  /**
+    * Computes the pvalues associated with several real scores at the current granularity,
+    * from a single distribution covering all of them. Returns the pmin and pmax that
+    * lookForPvalue would give for each score, interleaved: pmin0, pmax0, pmin1, pmax1, ...
+    * The pvalues are summed in a different order, so they only agree up to rounding.
+    */
+  vector<double> lookForPvalues (const vector<double> &requestedScores);
+    
   /**
     * Computes the score associated with the pvalue requestedPvalue.
     */
   long long lookForScore (long long min, long long max, double requestedPvalue, double *rpv, double *rppv);
     
+  /**
+    * One refinement pass of the score to pvalue computation: computes the integer matrix
+    * at the given granularity and the pvalue of the real score requestedScore, as in
+    * lookForPvalue. The pvalue is exact at this granularity when pmin == pmax.
+    */
+  void refinePvalue (double requestedScore, double granularity, double *pmin, double *pmax);
+    
+  /**
+    * One refinement pass of the pvalue to score computation: computes the integer matrix
+    * at the given granularity and the real score of the pvalue requestedPvalue.
+    * The integer score is searched between min and max, which are then updated for the
+    * next pass, decrgr times finer. rpv and rppv are set as in lookForScore; the score is
+    * exact at this granularity when they are equal.
+    */
+  void refineScore (double requestedPvalue, double granularity, int decrgr, long long *min, long long *max, double *score, double *rpv, double *rppv);
+    
   /** 
     * Computes the distribution of scores between score min and max as the DP algrithm proceeds 
     * but instead of using a table we use a map to avoid computations for scores that cannot be reached
@@ -189,11 +245,17 @@ public:
     
   }
 
-  void readMatrix (string matrix) {
+  /**
+    * Reads a row-concatenated matrix from a string.
+    * Returns false, leaving the matrix untouched, if the rows are of uneven length.
+    */
+  bool readMatrix (string matrix) {
     
     vector<string> str;
     tokenize(matrix, str, " \t|");
-    this->length = 0;
+    if (str.size() % 4 != 0) {
+      return false;
+    }
     this->length = str.size() / 4;
     mat = new double*[4];
     int idx = 0;
@@ -207,6 +269,7 @@ public:
     }
 
     str.clear();
+    return true;
     
   }
   
@@ -1,3 +1,7 @@
+import sys
+
+import pytest
+
 from pytfmpval import tfmp
 
 
@@ -11,3 +15,115 @@ def test_pval():
     m = tfmp.create_matrix("tests/MA0045.pfm")
 
     assert round(tfmp.score2pval(m, 8.7708), 5) == 0.00001
+
+
+def test_cache(monkeypatch):
+    m = tfmp.create_matrix("tests/MA0045.pfm")
+    pv = tfmp.score2pval(m, 8.7708)
+    assert 8.7708 in tfmp._pval_cache[m]
+
+    def refine(*args):
+        raise AssertionError("cached score was recomputed")
+
+    monkeypatch.setattr(m, "refinePvalue", refine)
+    assert tfmp.score2pval(m, 8.7708) == pv
+
+    tfmp.clear_cache(m)
+    assert m not in tfmp._pval_cache
+    monkeypatch.undo()
+    assert tfmp.score2pval(m, 8.7708) == pv
+
+
+def test_cache_size(monkeypatch):
+    monkeypatch.setattr(tfmp, "_CACHE_SIZE", 2)
+    m = tfmp.create_matrix("tests/MA0045.pfm")
+    tfmp.score2pval_many(m, [4.9336, 8.7708])
+    tfmp.score2pval(m, 4.9336)
+    tfmp.score2pval(m, 10.0)
+
+    assert list(tfmp._pval_cache[m]) == [4.9336, 10.0]
+
+
+def test_many():
+    m = tfmp.create_matrix("tests/MA0045.pfm")
+    scores = tfmp.pval2score_many(m, [0.001, 0.00001])
+    pvs = tfmp.score2pval_many(m, [8.7708, 4.9336])
+
+    assert [round(s, 2) for s in scores] == [4.93, 8.77]
+    assert [round(p, 5) for p in pvs] == [0.00001, 0.001]
+
+
+def test_uneven_matrix():
+    assert tfmp.read_matrix("3 7 9 3 11 11 11") is None
+
+
+def test_tolerance():
+    m = tfmp.create_matrix("tests/MA0045.pfm")
+    approx = tfmp.score2pval(m, 2.0, rtol=1e-3)
+    exact = tfmp.score2pval(m, 2.0, rtol=0)
+
+    assert approx != exact
+    assert abs(approx - exact) <= 1e-3 * exact
+
+
+def test_no_psutil(monkeypatch):
+    monkeypatch.setitem(sys.modules, "psutil", None)
+    monkeypatch.setattr(tfmp, "_psutil", None)
+    m = tfmp.create_matrix("tests/MA0045.pfm")
+
+    assert tfmp._available_memory() == float("inf")
+    assert round(tfmp.score2pval(m, 8.7708), 5) == 0.00001
+
+
+def test_converged():
+    assert tfmp._converged(0.1, 0.1 * (1 + 2 * sys.float_info.epsilon), 0, 0)
+    assert not tfmp._converged(0.1, 0.1 + 1e-12, 0, 0)
+    assert tfmp._converged(0.1, 0.1 + 1e-12, 1e-9, 0)
+
+
+def test_matrix_freed():
+    psutil = pytest.importorskip("psutil")
+    mat = open("tests/MA0045.pfm").read()
+
+    def create_and_delete(n):
+        for _ in range(n):
+            m = tfmp.read_matrix(mat)
+            m.computesIntegerMatrix(0.1)
+            m.lookForPvalue(100, 90, 110)
+            del m
+
+    create_and_delete(1000)
+    rss = psutil.Process().memory_info().rss
+    create_and_delete(5000)
+
+    # Leaking the matrices would take about 10 MB.
+    assert psutil.Process().memory_info().rss - rss < 3 * 1024 * 1024
+
+
+def test_pvalues_grouped():
+    m = tfmp.create_matrix("tests/MA0045.pfm", bg=[0.3, 0.2, 0.2, 0.3])
+
+    for granularity in [0.1, 0.01, 0.001, 0.0001]:
+        m.computesIntegerMatrix(granularity)
+        low = (m.minScore - m.offset) / m.granularity
+        high = (m.maxScore - m.offset) / m.granularity
+        span = tfmp._GROUP_SPAN * (high - low)
+        mid = high - (high - low) / 4
+        groups = [[mid, mid + 0.1 * span, mid + 0.5 * span, mid + span],
+                  [high - 0.5 * span, high, high + 0.5, high + 0.3 * span],
+                  [low - 0.3 * span, low - 0.5, low, low + 0.5 * span]]
+
+        for scores in groups:
+            bounds = m.lookForPvalues(scores)
+            for i, score in enumerate(scores):
+                base = score * m.granularity + m.offset
+                expected = m.lookForPvalue(int(base), int(base - m.errorMax - 1), int(base + m.errorMax + 1))
+                for x, y in zip(expected, bounds[2 * i:2 * i + 2]):
+                    assert abs(x - y) <= 1e-12 * abs(x)
+
+    scores = [high - 6, high - 5.9, high - 3, high + 0.5, low - 0.5]
+    pvs = tfmp.score2pval_many(m, scores, rtol=0)
+    tfmp.clear_cache(m)
+    for score, pv in zip(scores, pvs):
+        expected = tfmp.score2pval(m, score, rtol=0)
+        assert abs(expected - pv) <= 1e-9 * expected